@@ -1,15 +1,19 @@
 # Code by Chandler McDowell 2023
-import ast
-import csv
-import importlib
-from os import listdir
+import importlib.util
+import logging
+import mmap
+import sys
+from functools import lru_cache
+from os import scandir
+from os import stat
 from os.path import abspath
 from os.path import dirname
 from os.path import exists
+from os.path import getsize
 from os.path import isdir
-from os.path import isfile
 from os.path import join
 from typing import Callable
+from typing import NamedTuple
 
 import numpy as np
 
@@ -25,24 +29,63 @@ from omc.core.model.board import Board
 from omc.core.model.board import Piece
 from omc.core.model.board import Player
 
+logger = logging.getLogger(__name__)
+
 ''' File path to 'sets' directory '''
-SETS_DIR = dirname(abspath(__file__)) + '/../../resources/sets/'
+SETS_DIR = join(dirname(abspath(__file__)), '..', '..', 'resources', 'sets')
 
 ''' File path to 'pieces' directory inside of a set's directory '''
-SET_PIECES_DIR = '/pieces'
+SET_PIECES_DIR = 'pieces'
 
 ''' File path to 'scripts' directory inside of a set's directory '''
-SET_SCRIPTS_DIR = '/scripts'
+SET_SCRIPTS_DIR = 'scripts'
 
 ''' Standard name for the board file in a set '''
-BOARD_FILE_NAME = '/board.csv'
+BOARD_FILE_NAME = 'board.csv'
 
 ''' Number of values that should be in a board file '''
 NUM_BOARD_VALS = 3
 
+''' Separator between rows of a board layout '''
+BOARD_ROW_SEPARATOR = '/'
+
+''' Token denoting an empty space in a board layout '''
+EMPTY_SPACE_TOKEN = '.'
+
 ''' TypeVar representing subclasses of "Piece" '''
 PieceClass = Callable[..., Piece]
 
+''' Loaded piece maps keyed by set name, with the pieces directory mtime '''
+_PIECE_MAP_CACHE: dict[str, tuple[float, dict[str, PieceClass]]] = {}
+
+
+class SetPaths(NamedTuple):
+    """File paths of the parts of a set"""
+
+    root: str
+    pieces_dir: str
+    scripts_dir: str
+    board_file: str
+
+
+@lru_cache(maxsize=None)
+def get_set_paths(set_name: str) -> SetPaths:
+    """
+    Gets the file paths of a set, joined once per set
+
+    :param set_name: The selected set's folder name inside the 'sets' directory
+    :type set_name: str
+    :return: File paths of the set's directory, pieces, scripts and board
+    :rtype: SetPaths
+    """
+    root = join(SETS_DIR, set_name)
+    return SetPaths(
+        root,
+        join(root, SET_PIECES_DIR),
+        join(root, SET_SCRIPTS_DIR),
+        join(root, BOARD_FILE_NAME),
+    )
+
 
 def load_set(set_name: str) -> list:
     """
@@ -54,8 +97,7 @@ def load_set(set_name: str) -> list:
     :rtype: list
     """
 
-    # Sets the error code for the current method
-    file_path = SETS_DIR + set_name
+    file_path = get_set_paths(set_name).root
 
     if not isdir(file_path):
         raise SetNotFoundException(
@@ -71,6 +113,33 @@ def load_set(set_name: str) -> list:
     # return [[pieces,board,win,lose], None]
 
 
+def load_class(
+        module_name: str, file_path: str, class_name: str
+) -> PieceClass:
+    """
+    Loads a class from a python file, executing the file only the first time
+    its module is requested
+
+    :param module_name: Name to register the file's module under
+    :type module_name: str
+    :param file_path: Path to the python file
+    :type file_path: str
+    :param class_name: Name of the class inside the module
+    :type class_name: str
+    :return: The loaded class
+    :rtype: PieceClass
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f'Unable to load {file_path}')
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return getattr(module, class_name)
+
+
 def get_piece_map(set_name: str) -> dict[str, PieceClass]:
     """
     Gets all piece objects in a set
@@ -81,7 +150,7 @@ def get_piece_map(set_name: str) -> dict[str, PieceClass]:
     :rtype: list[Piece]
     """
     # Gets file_path for pieces
-    file_path = SETS_DIR + set_name + SET_PIECES_DIR
+    file_path = get_set_paths(set_name).pieces_dir
 
     if not isdir(file_path):
         raise PiecesNotFoundException(
@@ -89,22 +158,52 @@ def get_piece_map(set_name: str) -> dict[str, PieceClass]:
             f" directory."
         )
 
+    # Lists the directory once; entries carry their file type and stat
+    with scandir(file_path) as entries:
+        piece_entries = list(entries)
+
+    # Reuse the loaded piece classes if no piece file has changed since
+    mtime = max(
+        [stat(file_path).st_mtime]
+        + [entry.stat().st_mtime for entry in piece_entries]
+    )
+    cached = _PIECE_MAP_CACHE.get(set_name)
+    if cached is not None and cached[0] == mtime:
+        # A copy, so callers changing their map do not change the cache
+        return dict(cached[1])
+
+    set_package = '.'.join(
+        ['resources', 'sets'] + [part for part in set_name.split('/') if part]
+    )
+    if cached is not None:
+        # Piece files changed: drop every module of the set (helpers and
+        # pieces) so pieces importing each other are re-executed together,
+        # e.g. a pawn promoting to the reloaded queen
+        for module_name in [
+            name for name in sys.modules
+            if name.startswith(set_package + '.')
+        ]:
+            del sys.modules[module_name]
+        importlib.invalidate_caches()
+
     # Load the class dynamically
     pieces: dict[str, PieceClass] = {}
-    for file_name in listdir(file_path):
+    for entry in piece_entries:
+        file_name = entry.name
         if (
-                not isfile(join(file_path, file_name))
+                not entry.is_file()
                 or not file_name.endswith('.py')
                 or file_name == '__init__.py'
         ):
             continue
         piece_name = file_name.partition('.py')[0]
         piece_class_name = piece_name.title().replace('_', '')
-        loader = importlib.machinery.SourceFileLoader(
-            piece_class_name, file_path + '/' + file_name
+        # Registered under its package path, so pieces importing each other
+        # (e.g. a pawn promoting to a queen) share the same classes
+        module_name = '.'.join([set_package, SET_PIECES_DIR, piece_name])
+        pieces[piece_name] = load_class(
+            module_name, entry.path, piece_class_name
         )
-        piece_class = getattr(loader.load_module(), piece_class_name)
-        pieces[piece_name] = piece_class
 
     if not pieces:
         raise PiecesEmptyException(
@@ -112,7 +211,26 @@ def get_piece_map(set_name: str) -> dict[str, PieceClass]:
             f' empty.'
         )
 
-    return pieces
+    _PIECE_MAP_CACHE[set_name] = (mtime, pieces)
+    return dict(pieces)
+
+
+@lru_cache(maxsize=64)
+def parse_raw_piece_name(raw_piece_name: str) -> tuple[int, str]:
+    """
+    Splits a raw piece name into its initial controlling player number and
+    piece name
+
+    p2_pawn -> ('p2', '_', 'pawn') -> (2, 'pawn')
+
+    :param raw_piece_name: Piece name as written in a board layout
+    :type raw_piece_name: str
+    :return: The player number and piece name
+    :rtype: tuple[int, str]
+    :raises ValueError: If the player number is not an integer
+    """
+    player_str, _, piece_name = raw_piece_name.partition('_')
+    return int(player_str.lstrip('p')), piece_name
 
 
 def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
@@ -128,9 +246,9 @@ def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
     """
 
     # Initializes empty board and establishes file_path to set's board file
-    file_path = SETS_DIR + set_name + BOARD_FILE_NAME
+    file_path = get_set_paths(set_name).board_file
 
-    print(file_path)
+    logger.debug('Loading board from %s', file_path)
 
     if not exists(file_path):
         raise BoardNotFoundException(
@@ -138,28 +256,40 @@ def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
             f"'{BOARD_FILE_NAME}' file."
         )
 
-    # Tries to load the set's board file
+    # Tries to load the set's board file (a single line)
     raw_rows = ''
     raw_columns = ''
     raw_layout = ''
     try:
-        with open(file_path) as csv_file:
-            reader = csv.reader(csv_file, delimiter='|')
-            for row in reader:  # Only 1 row
-                if len(row) != 3:
-                    raise InvalidBoardFormatException(
-                        f'Error: The file {file_path} for set {set_name} has'
-                        f' malformed row {row}.'
-                    )
-                raw_rows = row[0]
-                raw_columns = row[1]
-                raw_layout = row[2]
+        line = ''
+        trailing = b''
+        if getsize(file_path) > 0:
+            with open(file_path, 'rb') as board_file, mmap.mmap(
+                    board_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                line = data.readline().rstrip(b'\r\n').decode('utf-8')
+                trailing = data.read()
     except UnicodeDecodeError:
         raise InvalidBoardLayoutException(
             f'\nError: The file {file_path} for set {set_name} is not a'
             f' properly formatted csv file.'
         )
 
+    if trailing.strip():
+        raise InvalidBoardLayoutException(
+            f'\nError: The file {file_path} for set {set_name} has content'
+            f' after the board line.'
+        )
+
+    if line:
+        row = line.split('|')
+        if len(row) != NUM_BOARD_VALS:
+            raise InvalidBoardFormatException(
+                f'Error: The file {file_path} for set {set_name} has'
+                f' malformed row {row}.'
+            )
+        raw_rows, raw_columns, raw_layout = row
+
     if len(raw_layout) == 0:
         raise EmptyBoardException(
             f'\nError: The file {file_path} for set {set_name} appears to be'
@@ -187,26 +317,67 @@ def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
         )
 
     # Converts from string to list
+    if raw_layout.startswith('['):
+        # Only legacy list layouts need the ast module
+        import ast
+
+        try:
+            # TODO fix this nasty nasty danger code
+            piece_name_layout = ast.literal_eval(raw_layout)
+        except ValueError:
+            raise InvalidBoardLayoutException(
+                f'\nError: Board layout in set {set_name} contains an invalid'
+                f' value type. Ensure that all strings have quotes around'
+                f' them.'
+            )
+    else:
+        # Grid layout: rows split by '/', spaces split by whitespace
+        tokens = [
+            row.split() for row in raw_layout.split(BOARD_ROW_SEPARATOR)
+        ]
+        if len({len(row) for row in tokens}) != 1:
+            raise InvalidBoardLayoutException(
+                f'\nError: Board layout in set {set_name} has rows of'
+                f' differing lengths.'
+            )
+        piece_name_layout = np.array(tokens, dtype=str)
+        piece_name_layout[piece_name_layout == EMPTY_SPACE_TOKEN] = ''
+
+    # No copy for grid layouts, which are already str arrays
     try:
-        # TODO fix this nasty nasty danger code
-        piece_name_layout: list = ast.literal_eval(raw_layout)
+        name_layout = np.asarray(piece_name_layout, dtype=str)
     except ValueError:
         raise InvalidBoardLayoutException(
-            f'\nError: Board layout in set {set_name} contains an invalid'
-            f' value type. Ensure that all strings have quotes around them.'
+            f'\nError: Board layout in set {set_name} has rows of'
+            f' differing lengths.'
         )
-
-    def get_player_number_from_raw_piece_name(raw_piece_name: str) -> int:
-        return int(raw_piece_name.partition('_')[0].lstrip('p'))
-
+    if name_layout.shape != (rows, columns):
+        raise InvalidBoardLayoutException(
+            f'\nError: Board layout in set {set_name} has shape'
+            f' {name_layout.shape}, but the board is {rows} rows by'
+            f' {columns} columns.'
+        )
+    # Parses each distinct piece name once
+    # p2_pawn -> ('p2', '_', 'pawn') -> 'p2' -> '2' -> 2
+    parsed_names: dict[str, tuple[int, str]] = {}
+    for raw_piece_name in np.unique(name_layout[name_layout != '']).tolist():
+        try:
+            parsed_names[raw_piece_name] = parse_raw_piece_name(raw_piece_name)
+        except ValueError:
+            cell = tuple(
+                np.argwhere(name_layout == raw_piece_name)[0].tolist()
+            )
+            raise InvalidBoardLayoutException(
+                f'\nError: Board layout in set {set_name} has piece'
+                f' {raw_piece_name!r} at {cell} without a valid player'
+                f' number.'
+            )
     player_numbers = {
-        get_player_number_from_raw_piece_name(x)
-        for x in np.array(piece_name_layout).flatten()
-        if x
+        player_number for player_number, _ in parsed_names.values()
     }
 
-    # inst empty board
-    board = Board.empty(0, (columns, rows))
+    # inst empty board, indexed like the layout: (row, column)
+    board = Board.empty(0, (rows, columns))
 
     # inst players
     players = {pn: Player(pn) for pn in player_numbers}
@@ -215,14 +386,11 @@ def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
     for player in players.values():
         board.add_player(player)
 
-    # inst pieces
+    # maps a raw piece name to a piece instance
     def piece_map_func(raw_piece_name, coord):
-        # converts raw piece name to the initial controlling player number
-        # p2_pawn -> ('p2', '_', 'pawn') -> 'p2' -> '2' -> 2
         if raw_piece_name == '':
             return None
-        player_number = get_player_number_from_raw_piece_name(raw_piece_name)
-        piece_name = raw_piece_name.partition('_')[2]
+        player_number, piece_name = parsed_names[raw_piece_name]
         piece_class = piece_map.get(piece_name)
         if piece_class:
             return piece_class(
@@ -230,17 +398,12 @@ def get_board(set_name: str, piece_map: dict[str, PieceClass]) -> Board:
             )
         return None
 
-    layout = np.empty(np.array([columns, rows]), dtype=Piece)
-    for coord, piece_name in np.ndenumerate(piece_name_layout):
-        layout[coord] = piece_map_func(piece_name, coord)
-
-    # assign pieces -> players and pieces -> board
-    for piece in layout.flatten():
-        if piece is None:
+    # inst pieces and assign pieces -> players and pieces -> board
+    for coord, piece_name in np.ndenumerate(name_layout):
+        piece = piece_map_func(piece_name, coord)
+        if piece is None or not board.add_piece(piece):
             continue
-        piece_owner = piece.player_controller
-        players[piece_owner].add_piece(piece)
-        board.add_piece(piece)
+        players[piece.player_controller].add_piece(piece)
 
-    print(f'\nSuccessfully loaded board from set {set_name}')
+    logger.info('Successfully loaded board from set %s', set_name)
     return board
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import logging
+import random
+from itertools import count
 from typing import Any
-from typing import cast
+from typing import Callable
 from typing import Collection
+from typing import Iterator
 
 import numpy as np
 from numpy import ndarray
@@ -13,6 +17,74 @@ from omc.core.exception.exception import NonCurrentPiecePlayerNumException
 from omc.core.exception.exception import PiecePixelHexOutOfBoundsException
 from omc.core.exception.exception import PieceSubclassInvalidException
 
+logger = logging.getLogger(__name__)
+
+''' Character displayed for a space without a piece '''
+EMPTY_SPACE_CHAR = ' '
+
+''' Source of the type ids given to Piece subclasses (0 means no piece) '''
+_PIECE_TYPE_IDS = count(1)
+
+''' Largest valid piece pixel-hex (all 64 pixels set) '''
+_PIXEL_HEX_MAX = (1 << 64) - 1
+
+''' Seeded source of the boards' Zobrist keys, kept apart from the global
+random module so hashing boards does not disturb its sequence '''
+_ZOBRIST_RANDOM = random.Random(0x0C0FFEE)
+
+
+def pixel_hex_to_rows(pixel_hex: int) -> tuple[int, ...]:
+    """
+    Unpack a 64-bit pixel-hex into the 8 rows of its 8x8 pixel grid.
+
+    :param pixel_hex: Hex value of 64-bit number representing an 8x8 pixel
+        grid
+    :type pixel_hex: int
+    :return: Rows of the pixel grid, top (most significant) row first
+    :rtype: tuple[int, ...]
+    """
+    return tuple((pixel_hex >> (8 * i)) & 0xFF for i in range(7, -1, -1))
+
+
+def _make_square_converters(
+        strides: tuple[int, ...]
+) -> tuple[
+    Callable[[tuple[int, ...]], int], Callable[[int], tuple[int, ...]]
+]:
+    """
+    Build the space to square index conversions for a board's strides,
+    specialized for its number of dimensions.
+
+    :param strides: Row-major strides of the board's dimensions
+    :type strides: tuple[int, ...]
+    :return: Functions converting a space to its square index and back
+    :rtype: tuple[Callable, Callable]
+    """
+    if len(strides) == 2:
+        width = strides[0]
+
+        def space_to_square_2d(space: tuple[int, ...]) -> int:
+            return int(space[0]) * width + int(space[1])
+
+        def square_to_space_2d(square: int) -> tuple[int, ...]:
+            return divmod(square, width)
+
+        return space_to_square_2d, square_to_space_2d
+
+    def space_to_square(space: tuple[int, ...]) -> int:
+        return sum(
+            int(coord) * stride for coord, stride in zip(space, strides)
+        )
+
+    def square_to_space(square: int) -> tuple[int, ...]:
+        space = []
+        for stride in strides:
+            coord, square = divmod(square, stride)
+            space.append(coord)
+        return tuple(space)
+
+    return space_to_square, square_to_space
+
 
 class Board:
     """
@@ -20,6 +92,18 @@ class Board:
      dimensions.
     """
 
+    __slots__ = (
+        '_board_id', '_dimensions', '_players', '_player_numbers',
+        '_strides', '_dims_arr', '_square_of', '_space_of',
+        '_pieces_by_square', '_occupancy', '_player_occupancy', '_ray_masks',
+        '_step_masks', '_slide_tables', '_type_occupancy',
+        '_board_state_hash', '_char_grid',
+    )
+
+    # Random 64-bit Zobrist key per (square, piece type, player), shared by
+    # all boards so equal positions hash equally
+    _ZOBRIST: dict[tuple[int, int, int], int] = {}
+
     def __init__(
             self, board_id: int, dimensions: tuple[int, ...],
             layout: ndarray[Piece | None, Any]
@@ -36,8 +120,57 @@ class Board:
         """
         self._board_id: int = board_id
         self._dimensions: tuple[int, ...] = dimensions
-        self._layout: ndarray[Piece | None, Any] = layout
-        self._players: dict[int, Player] = dict()
+        self._players: dict[int, Player] = {}
+        # Numbers of the current players, rebuilt when players change
+        self._player_numbers: tuple[int, ...] = ()
+
+        # Spaces are addressed internally by their row-major square index,
+        # into the piece table and the flat character grid below
+        self._strides: tuple[int, ...] = tuple(
+            int(np.prod(dimensions[i + 1:])) for i in range(len(dimensions))
+        )
+        self._dims_arr: ndarray[Any, Any] = np.asarray(
+            dimensions, dtype=np.int32
+        )
+        # Conversions bound once for the board's number of dimensions
+        self._square_of, self._space_of = _make_square_converters(
+            self._strides
+        )
+        layout_flat = np.asarray(layout).reshape(-1)
+        num_squares = layout_flat.size
+
+        # Piece on each occupied square; the layout is stored as this table
+        # and the bitboards and character grid kept in step with it
+        self._pieces_by_square: dict[int, Piece] = {}
+
+        # Bitboards: bit n is set when the space with square index n is
+        # occupied (by any piece / by a given player's pieces)
+        self._occupancy: int = 0
+        self._player_occupancy: dict[int, int] = {}
+        # Bitboard per (player, piece type id) plane
+        self._type_occupancy: dict[tuple[int, int], int] = {}
+        self._ray_masks: dict[tuple[int, tuple[int, ...], int], int] = {}
+        self._step_masks: dict[
+            tuple[int, tuple[tuple[int, ...], ...]], int
+        ] = {}
+        # Per (square, directions, max steps): the union of the rays and the
+        # attacked spaces for each occupancy of those rays seen so far
+        self._slide_tables: dict[
+            tuple[int, tuple[tuple[int, ...], ...], int],
+            tuple[int, dict[int, int]]
+        ] = {}
+
+        # Zobrist hash of the pieces on the board, updated incrementally
+        self._board_state_hash: int = 0
+
+        # Character of the piece on each square
+        self._char_grid: ndarray[Any, Any] = np.full(
+            num_squares, EMPTY_SPACE_CHAR, dtype='U1'
+        )
+        for square, piece in enumerate(layout_flat):
+            if isinstance(piece, Piece):
+                self._pieces_by_square[square] = piece
+                self._occupy(piece, square)
 
     @classmethod
     def empty(cls, board_id: int, dimensions: tuple[int, Any]) -> Board:
@@ -52,7 +185,7 @@ class Board:
         :rtype: Board
         """
         return Board(
-            board_id, dimensions, np.empty(tuple(dimensions), dtype=Piece)
+            board_id, dimensions, np.empty(dimensions, dtype=object)
         )
 
     @property
@@ -78,12 +211,22 @@ class Board:
     @property
     def layout(self) -> ndarray[Piece | None, Any]:
         """
-        Get layout of the board.
+        Get layout of the board, built from the board's piece table.
+
+        The layout is a read-only snapshot; use add_piece and remove_piece
+        to change the board.
 
-        :return: Layout of the board
+        :return: Read-only layout of the board
         :rtype: ndarray[Piece | None]
         """
-        return self._layout
+        layout: ndarray[Piece | None, Any] = np.empty(
+            self._char_grid.size, dtype=object
+        )
+        for square, piece in self._pieces_by_square.items():
+            layout[square] = piece
+        layout = layout.reshape(self._dimensions)
+        layout.setflags(write=False)
+        return layout
 
     def add_piece(self, piece: Piece) -> bool:
         """
@@ -94,10 +237,17 @@ class Board:
         :return: Whether piece addition was successful
         :rtype: bool
         """
-        if self.query_space(piece.current_coords) is not None:
-            print("There is already a piece at this location on the board.")
+        square = self._piece_square(piece)
+        if square < 0:
+            logger.debug("The piece's location is not on the board.")
             return False
-        self._layout[tuple(piece.current_coords)] = piece
+        if square in self._pieces_by_square:
+            logger.debug(
+                "There is already a piece at this location on the board."
+            )
+            return False
+        self._pieces_by_square[square] = piece
+        self._occupy(piece, square)
         return True
 
     def remove_piece(self, piece: Piece) -> bool:
@@ -109,12 +259,429 @@ class Board:
         :return: Whether piece removal was successful
         :rtype: bool
         """
-        if self.query_space(piece.current_coords) != piece:
-            print("The piece to remove does not belong to this board.")
+        square = self._piece_square(piece)
+        if self._pieces_by_square.get(square) is not piece:
+            logger.debug("The piece to remove does not belong to this board.")
+            return False
+        del self._pieces_by_square[square]
+        self._vacate(piece, square)
+        return True
+
+    def _piece_square(self, piece: Piece) -> int:
+        """
+        Get the square index of a piece's space on this board.
+
+        :param piece: The piece
+        :type piece: Piece
+        :return: Square index of the piece's space, or -1 if it is not on
+            the board
+        :rtype: int
+        """
+        if piece._board is self:
+            return piece._square
+        space = piece._current_coords
+        return self._square_of(space) if self.on_board(space) else -1
+
+    def _swap_piece(self, piece: Piece, space: tuple[int, ...]) -> bool:
+        """
+        Move a piece from its current space to another, taking any piece
+        occupying that space off the board, and update the piece's square
+        index.
+
+        :param piece: The piece to move
+        :type piece: Piece
+        :param space: coordinate denoting the space to move to
+        :type space: tuple[int, ...]
+        :return: Whether the piece was moved
+        :rtype: bool
+        """
+        if not self.on_board(space):
+            logger.debug("The piece's location is not on the board.")
             return False
-        self._layout[tuple(piece.current_coords)] = None
+        pieces_by_square = self._pieces_by_square
+        new_square = self._square_of(space)
+
+        captured_piece = pieces_by_square.pop(new_square, None)
+        if captured_piece is not None:
+            self._vacate(captured_piece, new_square)
+
+        old_square = self._piece_square(piece)
+        if pieces_by_square.get(old_square) is piece:
+            del pieces_by_square[old_square]
+            self._vacate(piece, old_square)
+
+        pieces_by_square[new_square] = piece
+        self._occupy(piece, new_square)
+        piece._square = new_square
         return True
 
+    def _occupy(self, piece: Piece, square: int) -> None:
+        """
+        Set the bitboards, hash and character for a piece placed on a square.
+
+        :param piece: The placed piece
+        :type piece: Piece
+        :param square: Square index of the piece's space
+        :type square: int
+        """
+        bit = 1 << square
+        player = piece.player_controller
+        self._occupancy |= bit
+        self._player_occupancy[player] = (
+            self._player_occupancy.get(player, 0) | bit
+        )
+        plane = (player, piece.TYPE_ID)
+        self._type_occupancy[plane] = self._type_occupancy.get(plane, 0) | bit
+        self._board_state_hash ^= self._zobrist_key(piece, square)
+        self._char_grid[square] = piece.piece_char
+
+    def _vacate(self, piece: Piece, square: int) -> None:
+        """
+        Clear the bitboards, hash and character for a piece taken off a
+        square.
+
+        :param piece: The removed piece
+        :type piece: Piece
+        :param square: Square index of the piece's space
+        :type square: int
+        """
+        bit = 1 << square
+        player = piece.player_controller
+        self._occupancy &= ~bit
+        self._player_occupancy[player] = (
+            self._player_occupancy.get(player, 0) & ~bit
+        )
+        plane = (player, piece.TYPE_ID)
+        self._type_occupancy[plane] = (
+            self._type_occupancy.get(plane, 0) & ~bit
+        )
+        self._board_state_hash ^= self._zobrist_key(piece, square)
+        self._char_grid[square] = EMPTY_SPACE_CHAR
+
+    @classmethod
+    def _zobrist_key(cls, piece: Piece, square: int) -> int:
+        """
+        Get the Zobrist key of a piece on a square, generating it on first
+        use.
+
+        :param piece: The piece
+        :type piece: Piece
+        :param square: Square index of the piece's space
+        :type square: int
+        :return: Random 64-bit key for the piece type, player and square
+        :rtype: int
+        """
+        key = (square, piece.TYPE_ID, piece.player_controller)
+        zobrist_key = cls._ZOBRIST.get(key)
+        if zobrist_key is None:
+            zobrist_key = cls._ZOBRIST[key] = _ZOBRIST_RANDOM.getrandbits(64)
+        return zobrist_key
+
+    @property
+    def board_state_hash(self) -> int:
+        """
+        Get the Zobrist hash of the pieces on the board. It is kept up to
+        date as pieces are added, removed, moved or change player.
+
+        :return: Hash of the board state
+        :rtype: int
+        """
+        return self._board_state_hash
+
+    def get_board_chars(self) -> str:
+        """
+        Get the command line display of the board, one line per row of the
+        layout and one character per space.
+
+        :return: Piece characters of the board, with empty spaces blank
+        :rtype: str
+        """
+        rows = self._char_grid.reshape(-1, self._dimensions[-1])
+        return '\n'.join(''.join(row) for row in rows.tolist())
+
+    def space_to_square(self, space: tuple[int, ...]) -> int:
+        """
+        Convert a space to its square index (its bit in a bitboard).
+
+        :param space: coordinate denoting the space
+        :type space: tuple[int, ...]
+        :return: Row-major flat index of the space
+        :rtype: int
+        """
+        return self._square_of(space)
+
+    def square_to_space(self, square: int) -> tuple[int, ...]:
+        """
+        Convert a square index back to the space it denotes.
+
+        :param square: Row-major flat index of the space
+        :type square: int
+        :return: coordinate denoting the space
+        :rtype: tuple[int, ...]
+        """
+        return self._space_of(square)
+
+    def bitboard_to_spaces(self, bitboard: int) -> list[tuple[int, ...]]:
+        """
+        List the spaces whose bits are set in a bitboard.
+
+        :param bitboard: Bitboard of spaces
+        :type bitboard: int
+        :return: Spaces in the bitboard, in square order
+        :rtype: list[tuple[int, ...]]
+        """
+        space_of = self._space_of
+
+        # The number of spaces is the bit count, so fill a list of that size
+        spaces: list[tuple[int, ...]] = [()] * bitboard.bit_count()
+        for index, square in enumerate(self.bit_scan_forward(bitboard)):
+            spaces[index] = space_of(square)
+        return spaces
+
+    @staticmethod
+    def bit_scan_forward(bitboard: int) -> Iterator[int]:
+        """
+        Yield the square indices of the bits set in a bitboard, lowest first.
+
+        :param bitboard: Bitboard of spaces
+        :type bitboard: int
+        :return: Square index of each set bit, in increasing order
+        :rtype: Iterator[int]
+        """
+        while bitboard:
+            lowest_bit = bitboard & -bitboard
+            yield lowest_bit.bit_length() - 1
+            bitboard ^= lowest_bit
+
+    def piece_bitboard(
+            self, player_number: int, piece_type: type[Piece]
+    ) -> int:
+        """
+        Get the bitboard of the spaces holding a player's pieces of a type.
+
+        :param player_number: Player controlling the pieces
+        :type player_number: int
+        :param piece_type: Piece subclass of the pieces
+        :type piece_type: type[Piece]
+        :return: Bitboard of the spaces holding the pieces
+        :rtype: int
+        """
+        return self._type_occupancy.get(
+            (player_number, piece_type.TYPE_ID), 0
+        )
+
+    def _ray_mask(
+            self, space: tuple[int, ...], direction: tuple[int, ...],
+            max_steps: int
+    ) -> int:
+        """
+        Get the bitboard of the spaces on a ray, excluding its origin. Masks
+        are computed once per ray and reused.
+
+        :param space: coordinate denoting the origin of the ray
+        :type space: tuple[int, ...]
+        :param direction: Step taken along the ray
+        :type direction: tuple[int, ...]
+        :param max_steps: Maximum number of steps along the ray
+        :type max_steps: int
+        :return: Bitboard of the ray's spaces on the board
+        :rtype: int
+        """
+        key = (self._square_of(space), direction, max_steps)
+        mask = self._ray_masks.get(key)
+        if mask is None:
+            mask = 0
+            step = tuple(
+                int(coord) + delta for coord, delta in zip(space, direction)
+            )
+            for _ in range(max_steps):
+                if not self.on_board(step):
+                    break
+                mask |= 1 << self._square_of(step)
+                step = tuple(
+                    coord + delta for coord, delta in zip(step, direction)
+                )
+            self._ray_masks[key] = mask
+        return mask
+
+    def ray_moves(
+            self, space: tuple[int, ...], direction: tuple[int, ...],
+            player_number: int, max_steps: int
+    ) -> int:
+        """
+        Get the spaces a player's piece can reach along a ray: every space
+        up to the first occupied one, which is included only if it belongs
+        to another player.
+
+        :param space: coordinate denoting the origin of the ray
+        :type space: tuple[int, ...]
+        :param direction: Step taken along the ray
+        :type direction: tuple[int, ...]
+        :param player_number: Player controlling the moving piece
+        :type player_number: int
+        :param max_steps: Maximum number of steps along the ray
+        :type max_steps: int
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        return self._ray_attacks(
+            space, direction, max_steps
+        ) & ~self._player_occupancy.get(player_number, 0)
+
+    def _ray_attacks(
+            self, space: tuple[int, ...], direction: tuple[int, ...],
+            max_steps: int
+    ) -> int:
+        """
+        Get the spaces attacked along a ray: every space up to and including
+        the first occupied one, whoever it belongs to.
+
+        :param space: coordinate denoting the origin of the ray
+        :type space: tuple[int, ...]
+        :param direction: Step taken along the ray
+        :type direction: tuple[int, ...]
+        :param max_steps: Maximum number of steps along the ray
+        :type max_steps: int
+        :return: Bitboard of the attacked spaces
+        :rtype: int
+        """
+        ray = self._ray_mask(space, direction, max_steps)
+        blockers = ray & self._occupancy
+        if not blockers:
+            return ray
+
+        # Square indices grow along a ray when its step has a positive
+        # square offset, so the first blocker is the lowest set bit
+        if self._square_of(direction) > 0:
+            first_blocker = blockers & -blockers
+            return ray & ((first_blocker << 1) - 1)
+        first_blocker = 1 << (blockers.bit_length() - 1)
+        return ray & ~(first_blocker - 1)
+
+    def slide_moves(
+            self, space: tuple[int, ...],
+            directions: tuple[tuple[int, ...], ...], player_number: int,
+            max_steps: int
+    ) -> int:
+        """
+        Get the spaces a player's piece can reach along any of several rays.
+        Like magic bitboards, the attacks are looked up by the occupancy of
+        the rays, and only worked out ray by ray the first time that
+        occupancy is seen.
+
+        :param space: coordinate denoting the origin of the rays
+        :type space: tuple[int, ...]
+        :param directions: Step taken along each ray
+        :type directions: tuple[tuple[int, ...], ...]
+        :param player_number: Player controlling the moving piece
+        :type player_number: int
+        :param max_steps: Maximum number of steps along each ray
+        :type max_steps: int
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        key = (self._square_of(space), directions, max_steps)
+        table = self._slide_tables.get(key)
+        if table is None:
+            slide_mask = 0
+            for direction in directions:
+                slide_mask |= self._ray_mask(space, direction, max_steps)
+            table = self._slide_tables[key] = (slide_mask, {})
+        slide_mask, attacks_by_occupancy = table
+
+        occupancy = self._occupancy & slide_mask
+        attacks = attacks_by_occupancy.get(occupancy)
+        if attacks is None:
+            attacks = 0
+            for direction in directions:
+                attacks |= self._ray_attacks(space, direction, max_steps)
+            attacks_by_occupancy[occupancy] = attacks
+        return attacks & ~self._player_occupancy.get(player_number, 0)
+
+    def _step_mask(
+            self, space: tuple[int, ...], steps: tuple[tuple[int, ...], ...]
+    ) -> int:
+        """
+        Get the bitboard of the spaces a single step away from a space. Masks
+        are computed once per space and set of steps, and reused.
+
+        :param space: coordinate denoting the origin of the steps
+        :type space: tuple[int, ...]
+        :param steps: Steps that can be taken from the space
+        :type steps: tuple[tuple[int, ...], ...]
+        :return: Bitboard of the stepped-to spaces on the board
+        :rtype: int
+        """
+        key = (self._square_of(space), steps)
+        mask = self._step_masks.get(key)
+        if mask is None:
+            mask = 0
+            for step in steps:
+                target = tuple(
+                    int(coord) + delta for coord, delta in zip(space, step)
+                )
+                if self.on_board(target):
+                    mask |= 1 << self._square_of(target)
+            self._step_masks[key] = mask
+        return mask
+
+    def step_moves(
+            self, space: tuple[int, ...], steps: tuple[tuple[int, ...], ...],
+            player_number: int
+    ) -> int:
+        """
+        Get the spaces a player's piece can reach by taking a single step:
+        every stepped-to space not occupied by the player's own pieces.
+
+        :param space: coordinate denoting the origin of the steps
+        :type space: tuple[int, ...]
+        :param steps: Steps that can be taken from the space
+        :type steps: tuple[tuple[int, ...], ...]
+        :param player_number: Player controlling the moving piece
+        :type player_number: int
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        return self._step_mask(space, steps) & ~self._player_occupancy.get(
+            player_number, 0
+        )
+
+    def step_quiet_moves(
+            self, space: tuple[int, ...], steps: tuple[tuple[int, ...], ...]
+    ) -> int:
+        """
+        Get the empty spaces a single step away from a space.
+
+        :param space: coordinate denoting the origin of the steps
+        :type space: tuple[int, ...]
+        :param steps: Steps that can be taken from the space
+        :type steps: tuple[tuple[int, ...], ...]
+        :return: Bitboard of the empty stepped-to spaces
+        :rtype: int
+        """
+        return self._step_mask(space, steps) & ~self._occupancy
+
+    def step_captures(
+            self, space: tuple[int, ...], steps: tuple[tuple[int, ...], ...],
+            player_number: int
+    ) -> int:
+        """
+        Get the spaces a single step away from a space that hold another
+        player's pieces.
+
+        :param space: coordinate denoting the origin of the steps
+        :type space: tuple[int, ...]
+        :param steps: Steps that can be taken from the space
+        :type steps: tuple[tuple[int, ...], ...]
+        :param player_number: Player controlling the moving piece
+        :type player_number: int
+        :return: Bitboard of the capturable stepped-to spaces
+        :rtype: int
+        """
+        return self._step_mask(space, steps) & self._occupancy & (
+            ~self._player_occupancy.get(player_number, 0)
+        )
+
     @property
     def current_players(self) -> dict[int, Player]:
         """
@@ -135,9 +702,10 @@ class Board:
         :rtype: bool
         """
         if player.player_number in self._players:
-            print("The player to add is already on the board.")
+            logger.debug("The player to add is already on the board.")
             return False
         self._players[player.player_number] = player
+        self._player_numbers = tuple(self._players)
         return True
 
     def remove_player(self, player: Player) -> bool:
@@ -150,9 +718,10 @@ class Board:
         :rtype: bool
         """
         if player.player_number not in self._players:
-            print("The player to remove isn't on the board.")
+            logger.debug("The player to remove isn't on the board.")
             return False
         del self._players[player.player_number]
+        self._player_numbers = tuple(self._players)
         return True
 
     def get_player(self, player_number: int) -> Player:
@@ -175,11 +744,18 @@ class Board:
         :return: True if the instances are considered equal, False otherwise.
         :rtype: bool
         """
+        if self is other:
+            return True
         if isinstance(other, Board):
+            # Boards holding different pieces (almost surely) hash apart,
+            # including pieces of different types with equal attributes
+            if self._board_state_hash != other._board_state_hash:
+                return False
             return (
                 self.id == other.id
                 and self.dimensions == other.dimensions
-                and np.array_equal(self.layout, other.layout)
+                and self._players.keys() == other._players.keys()
+                and self._pieces_by_square == other._pieces_by_square
                 and self.current_players == other.current_players
             )
         return False
@@ -193,13 +769,29 @@ class Board:
         :return: Whether the space is on the board
         :rtype: bool
         """
-        return all(
-            [
-                0 <= coord < dim
-                for coord, dim in zip(space, self._dimensions)
-            ]
+        dimensions = self._dimensions
+        if len(space) == 2 and len(dimensions) == 2:
+            return (
+                0 <= space[0] < dimensions[0]
+                and 0 <= space[1] < dimensions[1]
+            )
+        return len(space) == len(dimensions) and all(
+            0 <= coord < dim for coord, dim in zip(space, dimensions)
         )
 
+    def on_board_batch(self, spaces: ndarray[Any, Any]) -> ndarray[Any, Any]:
+        """
+        Query whether each of many spaces is on the board at once
+
+        :param spaces: Array of shape (number of spaces, number of
+            dimensions) denoting the spaces to be queried
+        :type spaces: ndarray
+        :return: Boolean mask of the spaces on the board
+        :rtype: ndarray
+        """
+        spaces = np.asarray(spaces).reshape(-1, len(self._dimensions))
+        return ((spaces >= 0) & (spaces < self._dims_arr)).all(axis=1)
+
     def query_space(self, space: tuple[int, ...]) -> Piece | None:
         """
         Query a space for what piece exists there, if any, or None otherwise.
@@ -209,10 +801,31 @@ class Board:
         :return: Piece at the queried space in the layout
         :rtype: Piece | None
         """
-        try:
-            return cast(Piece | None, self._layout[space])
-        except IndexError:
-            return None  # Handle out-of-bounds coordinates
+        if not self.on_board(space):
+            return None
+        return self._pieces_by_square.get(self._square_of(space))
+
+    def query_batch(self, spaces: ndarray[Any, Any]) -> list[Piece | None]:
+        """
+        Query many spaces at once for what piece exists at each, if any, or
+        None otherwise.
+
+        :param spaces: Array of shape (number of spaces, number of
+            dimensions) denoting the spaces to be queried
+        :type spaces: ndarray
+        :return: Piece at each queried space in the layout, in order
+        :rtype: list[Piece | None]
+        """
+        spaces = np.asarray(spaces).reshape(-1, len(self._dimensions))
+        on_board = self.on_board_batch(spaces)
+
+        # Square index of every space on the board in one matrix product;
+        # off-board spaces are given square -1, which no piece occupies
+        squares = np.where(
+            on_board, spaces @ np.asarray(self._strides), -1
+        ).tolist()
+        piece_at = self._pieces_by_square.get
+        return [piece_at(square) for square in squares]
 
 
 class Piece:
@@ -221,9 +834,56 @@ class Piece:
      controlling player, and coordinates.
     """
 
+    __slots__ = (
+        '_board', '_ndim', '_piece_char', '_piece_pxl_hex', '_current_coords',
+        '_square', '_starting_coords', '_player_controller', '_moves_cache',
+        '_moves_cache_set', '_moves_cache_key',
+    )
+
     DEFAULT_PIECE_CHAR: str = ''
     DEFAULT_PIECE_PIXEL_HEX: int = 0
 
+    # 8 rows of the default pixel grid, top row first, 1 byte per row
+    DEFAULT_PIECE_PIXEL_ROWS: tuple[int, ...] = (0,) * 8
+
+    # Number identifying the piece's class on a board's type grid
+    TYPE_ID: int = 0
+
+    # Why the subclass's defaults are invalid, or None if they are valid
+    _SUBCLASS_ERROR: str | None = None
+
+    # Actions the piece can perform, and the same as a set for lookups
+    _ACTIONS: tuple[str, ...] = ("move", "control")
+    _ACTION_SET: frozenset[str] = frozenset(_ACTIONS)
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """
+        Give a piece subclass its type id, action set and unpack its default
+        pixel-hex into pixel rows once, when the subclass is defined. The
+        subclass's defaults are validated here too, and the error raised
+        when the subclass is instantiated.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._SUBCLASS_ERROR = None
+        if cls.DEFAULT_PIECE_CHAR == '':
+            cls._SUBCLASS_ERROR = (
+                "Error: Default piece character for piece"
+                f" {cls.__name__} is missing. Please set"
+                " default piece character to a 1 character string."
+            )
+        elif not 1 <= cls.DEFAULT_PIECE_PIXEL_HEX <= _PIXEL_HEX_MAX:
+            cls._SUBCLASS_ERROR = (
+                "Error: Default piece pixel-hex for"
+                f" {cls.__name__} is out of bounds. Default"
+                f" pixel-hex is {cls.DEFAULT_PIECE_PIXEL_HEX} which is not"
+                " between 1 and 2^64 - 1."
+            )
+        cls.TYPE_ID = next(_PIECE_TYPE_IDS)
+        cls._ACTION_SET = frozenset(cls._ACTIONS)
+        cls.DEFAULT_PIECE_PIXEL_ROWS = pixel_hex_to_rows(
+            cls.DEFAULT_PIECE_PIXEL_HEX
+        )
+
     def __init__(
             self, board: Board,
             piece_char: str | None = None,
@@ -251,65 +911,49 @@ class Piece:
         :type player_controller: int | None
         """
         # Assertions to validate subclassing
-        if self.__class__.__name__ == 'Piece':
+        if type(self) is Piece:
             raise NotImplementedError(
                 'Attempted to instantiate base Piece class directly'
             )
 
-        if self.DEFAULT_PIECE_CHAR == '':
-            raise PieceSubclassInvalidException(
-                "Error: Default piece character for piece"
-                f" {self.__class__.__name__} is missing. Please set"
-                " default piece character to a 1 character string."
-            )
-
-        if (
-                self.DEFAULT_PIECE_PIXEL_HEX < 1
-                or self.DEFAULT_PIECE_PIXEL_HEX > (2 ** 64) - 1
-        ):
-            raise PieceSubclassInvalidException(
-                "Error: Default piece pixel-hex for"
-                f" {self.__class__.__name__} is out of bounds. Default"
-                f" pixel-hex is {piece_pxl_hex} which is not between 1 and"
-                " 2^64 - 1."
-            )
+        if self._SUBCLASS_ERROR is not None:
+            raise PieceSubclassInvalidException(self._SUBCLASS_ERROR)
 
         # Override defaults
         if piece_char is None:
             piece_char = self.DEFAULT_PIECE_CHAR
 
+        # The default pixel-hex was validated with the subclass, so only an
+        # overriding pixel-hex needs checking
         if piece_pxl_hex is None:
             piece_pxl_hex = self.DEFAULT_PIECE_PIXEL_HEX
+        elif piece_pxl_hex < 1 or piece_pxl_hex > _PIXEL_HEX_MAX:
+            raise PiecePixelHexOutOfBoundsException(
+                "Error: Piece pixel-hex for"
+                f" {self.__class__.__name__} is out of bounds. Pixel-hex"
+                f" is {piece_pxl_hex} which is not between 1 and 2^64 - 1."
+            )
 
         if current_coords is None:
-            current_coords = tuple([0] * len(board.dimensions))
+            current_coords = (0,) * len(board.dimensions)
 
         if player_controller is None:
             player_controller = 1
 
         # Set values
         self._board = board
+        self._ndim = len(board.dimensions)
 
         if len(piece_char) > 1:
-            print(
-                "Warning: Piece character for piece"
-                f" {self.__class__.__name__} is too long. Length of piece"
-                f" character is {len(piece_char)} which is longer than 1."
-                " Piece character has been set to the first character,"
-                f" {piece_char[0]}."
+            logger.warning(
+                "Piece character for piece %s is too long. Length of piece"
+                " character is %d which is longer than 1. Piece character"
+                " has been set to the first character, %s.",
+                self.__class__.__name__, len(piece_char), piece_char[0]
             )
             piece_char = piece_char[0]
 
         self._piece_char = piece_char
-
-        # Ensure piece pixel-hex is valid
-        if piece_pxl_hex < 1 or piece_pxl_hex > (2 ** 64) - 1:
-            raise PiecePixelHexOutOfBoundsException(
-                "Error: Piece pixel-hex for"
-                f" {self.__class__.__name__} is out of bounds. Pixel-hex"
-                f" is {piece_pxl_hex} which is not between 1 and 2^64 - 1."
-            )
-
         self._piece_pxl_hex = piece_pxl_hex
 
         if current_coords[0] < 0 or current_coords[1] < 0:
@@ -321,6 +965,11 @@ class Piece:
 
         self._current_coords = current_coords
         self._starting_coords = current_coords
+        # Square index of the piece's space on its board (-1 if off it)
+        self._square = (
+            board._square_of(current_coords) if board.on_board(current_coords)
+            else -1
+        )
 
         if player_controller < 0:
             raise NegativePiecePlayerNumException(
@@ -337,6 +986,13 @@ class Piece:
 
         self._player_controller = player_controller
 
+        # Moves last generated for the piece, the same as a set (built when
+        # first needed), and the board state hash, coordinates and player
+        # controller they were generated for
+        self._moves_cache: tuple[tuple[int, ...], ...] = ()
+        self._moves_cache_set: frozenset[tuple[int, ...]] | None = None
+        self._moves_cache_key: tuple[int, tuple[int, ...], int] | None = None
+
     @property
     def piece_char(self) -> str:
         """
@@ -361,15 +1017,42 @@ class Piece:
         return self._piece_pxl_hex
 
     @property
-    def current_players(self) -> list[int]:
+    def piece_pxl_rows(self) -> tuple[int, ...]:
+        """
+        Gets the pixel-hex representation for the piece as 8 pixel rows.
+
+        :return: Rows of the 8x8 pixel grid, top row first, where bit 7 of
+            each row is its leftmost pixel.
+        :rtype: tuple[int, ...]
         """
-        Gets the list of current players from board.
+        if self._piece_pxl_hex == self.DEFAULT_PIECE_PIXEL_HEX:
+            return self.DEFAULT_PIECE_PIXEL_ROWS
+        return pixel_hex_to_rows(self._piece_pxl_hex)
 
-        :return: List of the current player numbers
-        :rtype: list[int]
+    @property
+    def piece_pxl_grid(self) -> ndarray[Any, Any]:
         """
+        Gets the pixel-hex representation for the piece as an 8x8 grid.
 
-        return list(self._board.current_players.keys())
+        :return: 8x8 grid of 0/1 pixels, top row first and leftmost pixel
+            first in each row.
+        :rtype: ndarray
+        """
+        pixel_bytes = np.frombuffer(
+            self._piece_pxl_hex.to_bytes(8, 'big'), dtype=np.uint8
+        )
+        return np.unpackbits(pixel_bytes).reshape(8, 8)
+
+    @property
+    def current_players(self) -> Collection[int]:
+        """
+        Gets the current players from board.
+
+        :return: The current player numbers
+        :rtype: Collection[int]
+        """
+
+        return self._board._player_numbers
 
     @property
     def board_id(self) -> int:
@@ -412,6 +1095,48 @@ class Piece:
 
         raise NotImplementedError
 
+    def _generate_moves(self) -> list[tuple[int, ...]]:
+        """
+        Lists the piece's moves without the memo. Subclasses whose
+        list_moves reads the memo override this to generate the moves.
+
+        :return: List of moves currently able to be performed by
+            the piece.
+        :rtype: list[tuple[int, ...]]
+        """
+        return self.list_moves()
+
+    def _cached_moves(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Gives the piece's moves, only generating them again once the board,
+        the piece's coordinates or its player controller have changed.
+
+        :return: Moves currently able to be performed by the piece.
+        :rtype: tuple[tuple[int, ...], ...]
+        """
+        key = (
+            self._board._board_state_hash, self._current_coords,
+            self._player_controller
+        )
+        if key != self._moves_cache_key:
+            self._moves_cache = tuple(self._generate_moves())
+            self._moves_cache_set = None
+            self._moves_cache_key = key
+        return self._moves_cache
+
+    def _moves_set(self) -> frozenset[tuple[int, ...]]:
+        """
+        Gives the piece's memoized moves as a set.
+
+        :return: Set of moves currently able to be performed by
+            the piece.
+        :rtype: frozenset[tuple[int, ...]]
+        """
+        moves = self._cached_moves()
+        if self._moves_cache_set is None:
+            self._moves_cache_set = frozenset(moves)
+        return self._moves_cache_set
+
     def move(self, coords: tuple[int, ...]) -> bool:
         """
         Performs an action on the piece using arguments.
@@ -422,17 +1147,17 @@ class Piece:
         :rtype: bool
         """
 
-        # Check if move is valid
-        if coords not in self.list_moves():
-            print("Invalid Move.")
+        # Check if move is valid; moves are tuples, so other sequences such
+        # as lists never match (and could not be hashed for the lookup)
+        if not isinstance(coords, tuple) or coords not in self._moves_set():
+            logger.debug("Invalid Move.")
             return False
 
-        self._board.remove_piece(self)
+        # The board also updates the piece's square index
+        board = self._board
+        if not board._swap_piece(self, coords):
+            return False
         self._current_coords = coords
-        capture_piece = self._board.query_space(coords)
-        if capture_piece is not None:
-            self._board.remove_piece(capture_piece)
-        self._board.add_piece(self)
         return True
 
     def set_player_control(self, new_player: int) -> bool:
@@ -446,18 +1171,28 @@ class Piece:
         """
 
         if new_player < 0:
-            print("Invalid Player Number (Negative).")
+            logger.debug("Invalid Player Number (Negative).")
             return False
 
         valid_players = self.current_players
 
         if new_player not in valid_players:
-            print(f"Invalid Player Number. (Valid Numbers: {valid_players})")
+            logger.debug(
+                "Invalid Player Number. (Valid Numbers: %s)", valid_players
+            )
             return False
 
+        # Re-place the piece so the board tracks its new controller
+        on_board = self._board._pieces_by_square.get(self._square) is self
+        if on_board:
+            self._board.remove_piece(self)
+
         self._board.current_players[self._player_controller].remove_piece(self)
         self._player_controller = new_player
         self._board.current_players[new_player].add_piece(self)
+
+        if on_board:
+            self._board.add_piece(self)
         return True
 
     @classmethod
@@ -470,7 +1205,7 @@ class Piece:
         :rtype: list[str]
         """
 
-        return ["move", "control"]
+        return list(cls._ACTIONS)
 
     def perform_action(self, action: str, args: list[str]) -> bool:
         """
@@ -485,25 +1220,32 @@ class Piece:
         """
 
         # Check if action is valid
-        if action not in self.list_actions():
-            print(f"Invalid Action. Valid Actions: {self.list_actions()}")
+        if action not in self._ACTION_SET:
+            logger.debug(
+                "Invalid Action. Valid Actions: %s", list(self._ACTIONS)
+            )
             return False
 
         if action == "move":
-            num_dimensions = len(self._board.dimensions)
-            try:
-                coords = tuple([
-                    int(args[i]) for i in range(num_dimensions)
-                ])
-            except IndexError:
-                print(f"Invalid arguments for action {action}. Arguments must"
-                      f" be {num_dimensions} integers for"
-                      f" {num_dimensions}-dimensional board.")
+            num_dimensions = self._ndim
+            if len(args) < num_dimensions:
+                logger.debug(
+                    "Invalid arguments for action %s. Arguments must be %d"
+                    " integers for %d-dimensional board.",
+                    action, num_dimensions, num_dimensions
+                )
                 return False
+            try:
+                if num_dimensions == 2:
+                    coords: tuple[int, ...] = (int(args[0]), int(args[1]))
+                else:
+                    coords = tuple(map(int, args[:num_dimensions]))
             except ValueError:
-                print(f"Invalid arguments for action {action}. Arguments must"
-                      f" be {num_dimensions} integers for"
-                      f" {num_dimensions}-dimensional board.")
+                logger.debug(
+                    "Invalid arguments for action %s. Arguments must be %d"
+                    " integers for %d-dimensional board.",
+                    action, num_dimensions, num_dimensions
+                )
                 return False
 
             return self.move(coords)
@@ -511,8 +1253,10 @@ class Piece:
             try:
                 player_controller = int(args[0])
             except ValueError:
-                print(f"Invalid arguments for action {action}. Argument must"
-                      " be one integer.")
+                logger.debug(
+                    "Invalid arguments for action %s. Argument must be one"
+                    " integer.", action
+                )
                 return False
 
             return self.set_player_control(player_controller)
@@ -528,14 +1272,16 @@ class Piece:
         :return: True if the instances are considered equal, False otherwise.
         :rtype: bool
         """
+        if self is other:
+            return True
+        # The current players are left out, being those of the board
         if isinstance(other, Piece):
             return (
-                self.board_id == other.board_id
-                and self.current_coords == other.current_coords
-                and self.current_players == other.current_players
-                and self.player_controller == other.player_controller
-                and self.piece_pxl_hex == other.piece_pxl_hex
-                and self.piece_char == other.piece_char
+                self._board.id == other._board.id
+                and self._current_coords == other._current_coords
+                and self._player_controller == other._player_controller
+                and self._piece_pxl_hex == other._piece_pxl_hex
+                and self._piece_char == other._piece_char
             )
         return False
 
@@ -546,6 +1292,8 @@ class Player:
      pieces.
     """
 
+    __slots__ = ('_pieces', '_player_number')
+
     def __init__(self, player_number: int):
         """
         Initialize an instance of Piece.
@@ -553,7 +1301,8 @@ class Player:
         :param player_number: The board the piece belongs to.
         :ptype player_number: int
         """
-        self._pieces: list[Piece,] = []
+        # Pieces keyed by id(), in the order they were added
+        self._pieces: dict[int, Piece] = {}
         self._player_number = player_number
 
     @property
@@ -574,7 +1323,7 @@ class Player:
         :return: Collection of pieces owned by the player
         :rtype: Collection[Piece]
         """
-        return self._pieces
+        return self._pieces.values()
 
     def add_piece(self, piece: Piece) -> bool:
         """
@@ -586,12 +1335,15 @@ class Player:
         :rtype: bool
         """
         if piece.player_controller != self.player_number:
-            print("The piece to add is not controlled by this player.")
+            logger.debug("The piece to add is not controlled by this player.")
             return False
-        if piece in self._pieces:
-            print("The piece to add is already controlled by this player.")
+        key = id(piece)
+        if key in self._pieces:
+            logger.debug(
+                "The piece to add is already controlled by this player."
+            )
             return False
-        self._pieces.append(piece)
+        self._pieces[key] = piece
         return True
 
     def remove_piece(self, piece: Piece) -> bool:
@@ -603,10 +1355,11 @@ class Player:
         :return: Whether the piece removal was successful
         :rtype: bool
         """
-        if piece not in self._pieces:
-            print("The piece to remove is not controlled by this player.")
+        if self._pieces.pop(id(piece), None) is None:
+            logger.debug(
+                "The piece to remove is not controlled by this player."
+            )
             return False
-        self._pieces.remove(piece)
         return True
 
     def __eq__(self, other: Any):
@@ -618,9 +1371,16 @@ class Player:
         :return: True if the instances are considered equal, False otherwise.
         :rtype: bool
         """
+        if self is other:
+            return True
         if isinstance(other, Player):
-            return (
-                self.player_number == other.player_number
-                and self.pieces == other.pieces
-            )
+            if (
+                    self._player_number != other._player_number
+                    or len(self._pieces) != len(other._pieces)
+            ):
+                return False
+            # Same piece objects in the same order
+            if list(self._pieces) == list(other._pieces):
+                return True
+            return list(self._pieces.values()) == list(other._pieces.values())
         return False
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def _frozen_directions(directions: list[list[int]]) -> np.ndarray:
+    """
+    Build a read-only, C-contiguous table of directions.
+
+    :param directions: Each direction as a [dx, dy] pair
+    :type directions: list[list[int]]
+    :return: Table of the directions, one (dx, dy) row each
+    :rtype: np.ndarray
+    """
+    table = np.array(directions, dtype=np.int8)
+    table.setflags(write=False)
+    return table
+
+
+''' Orthogonal directions, shared by rooks and queens '''
+ROOK_DIRS = _frozen_directions([
+    [1, 0],
+    [-1, 0],
+    [0, -1],
+    [0, 1],
+])
+
+''' Diagonal directions, shared by bishops and queens '''
+BISHOP_DIRS = _frozen_directions([
+    [1, 1],
+    [-1, 1],
+    [-1, -1],
+    [1, -1],
+])
+
+''' Orthogonal and diagonal directions of a king '''
+KING_DIRS = _frozen_directions([
+    [1, 0],
+    [1, 1],
+    [0, 1],
+    [-1, 1],
+    [-1, 0],
+    [-1, -1],
+    [0, -1],
+    [1, -1],
+])
+
+''' A queen moves in the same directions as a king, over many steps '''
+QUEEN_DIRS = KING_DIRS
+
+''' L-shaped jumps of a knight '''
+KNIGHT_DIRS = _frozen_directions([
+    [2, 1],
+    [1, 2],
+    [-1, 2],
+    [-2, 1],
+    [-2, -1],
+    [-1, -2],
+    [1, -2],
+    [2, -1],
+])
+
+''' Steps of a pawn per forward direction along the rows (0: toward row 0,
+for a player starting at the bottom rows; 1: toward the last row, for a
+player starting at the top rows): single push, double push and the two
+diagonal captures '''
+PAWN_OFFSETS = np.stack([
+    _frozen_directions([[-1, 0], [-2, 0], [-1, 1], [-1, -1]]),
+    _frozen_directions([[1, 0], [2, 0], [1, 1], [1, -1]]),
+])
+PAWN_OFFSETS.setflags(write=False)
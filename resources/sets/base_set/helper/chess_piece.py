@@ -1,4 +1,8 @@
-from typing import Iterable
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+
+import numpy as np
 
 from omc.core.model.board import Piece
 
@@ -6,40 +10,85 @@ from omc.core.model.board import Piece
 class ChessPiece(Piece):
     """Object representing a chess piece."""
 
+    __slots__ = ()
+
     # Whether or not a piece can move more than one unit in a given direction
     MULTI_STEP: bool = False
 
-    # Each direction to consider for valid moves
-    DIRECTIONS: Iterable[tuple[int, ...]] = tuple()
+    # Each direction to consider for valid moves, one (dx, dy) row each
+    DIRECTIONS: np.ndarray = np.empty((0, 2), dtype=np.int8)
 
-    def list_moves(self) -> list[tuple[int, ...]]:
+    # DIRECTIONS as hashable tuples of Python ints, for the board's tables
+    DIRECTION_STEPS: tuple[tuple[int, ...], ...] = ()
+
+    # Bitboard move generator chosen for the subclass from MULTI_STEP, or
+    # defined by the subclass itself
+    _moves_bitboard: ClassVar[Callable[['ChessPiece'], int]]
+
+    def __init_subclass__(cls, **kwargs: Any):
+        """
+        Convert a chess piece subclass's directions to steps and pick its
+        move generator once, when the subclass is defined, unless the
+        subclass or an ancestor defines its own.
         """
-        Gives a list of all available moves for the piece.
+        super().__init_subclass__(**kwargs)
+        cls.DIRECTION_STEPS = tuple(
+            tuple(direction) for direction in cls.DIRECTIONS.tolist()
+        )
+        # Keep a generator defined by the subclass or one of its chess piece
+        # ancestors; only the generic generators are picked from MULTI_STEP
+        if getattr(cls, '_moves_bitboard', None) in (
+                None, ChessPiece._ray_moves_bitboard,
+                ChessPiece._step_moves_bitboard
+        ):
+            cls._moves_bitboard = (
+                ChessPiece._ray_moves_bitboard if cls.MULTI_STEP
+                else ChessPiece._step_moves_bitboard
+            )
 
-        :return: List of moves currently able to be performed by
-            the piece.
-        :rtype: list[tuple[int, ...]]
+    def _step_moves_bitboard(self) -> int:
         """
+        Gives the spaces the piece can reach with a single step in any of
+        its directions, from a per-space table of stepped-to spaces.
 
-        moves = []
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        return self._board.step_moves(
+            self._current_coords, self.DIRECTION_STEPS,
+            self._player_controller
+        )
 
-        # Consider all valid directions
-        for direction in self.DIRECTIONS:
-            try_move = self._current_coords + direction
-            while self._board.on_board(try_move):
-                try_query = self._board.query_space(try_move)
-                # Consider open spaces
-                if try_query is None:
-                    moves.append(try_move)
-                # Consider captures
-                elif try_query.player_controller != self.player_controller:
-                    moves.append(try_move)
-                    break
+    def _ray_moves_bitboard(self) -> int:
+        """
+        Gives the spaces the piece can reach along any of its directions.
 
-                # Consider multiple steps in same direction if able
-                if not self.MULTI_STEP:
-                    break
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        board = self._board
+        return board.slide_moves(
+            self._current_coords, self.DIRECTION_STEPS,
+            self._player_controller, max(board.dimensions)
+        )
 
-                try_move += direction
+    def _generate_moves(self) -> list[tuple[int, ...]]:
+        """
+        Lists the spaces in the piece's move bitboard.
 
-        return moves
+        :return: List of moves currently able to be performed by
+            the piece.
+        :rtype: list[tuple[int, ...]]
+        """
+        return self._board.bitboard_to_spaces(self._moves_bitboard())
+
+    def list_moves(self) -> list[tuple[int, ...]]:
+        """
+        Gives a list of all available moves for the piece, reused while the
+        board is in the same state.
+
+        :return: List of moves currently able to be performed by
+            the piece.
+        :rtype: list[tuple[int, ...]]
+        """
+        return list(self._cached_moves())
@@ -1,18 +1,12 @@
+from resources.sets.base_set.helper._dirtables import KING_DIRS
 from resources.sets.base_set.helper.chess_piece import ChessPiece
 
 
 class King(ChessPiece):
     """Object representing a king piece."""
 
+    __slots__ = ()
+
     DEFAULT_PIECE_CHAR: str = 'K'
     DEFAULT_PIECE_PIXEL_HEX: int = 0x183C187E7E3C3C7E
-    DIRECTIONS = (
-        (1, 0),
-        (1, 1),
-        (0, 1),
-        (-1, 1),
-        (-1, 0),
-        (-1, -1),
-        (0, -1),
-        (1, -1),
-    )
+    DIRECTIONS = KING_DIRS
@@ -1,13 +1,24 @@
-from typing import cast
-
 from omc.core.model.board import Board
+from resources.sets.base_set.helper._dirtables import PAWN_OFFSETS
 from resources.sets.base_set.helper.chess_piece import ChessPiece
 from resources.sets.base_set.pieces.queen import Queen
 
+''' Push, double push and capture steps per forward direction index '''
+_PAWN_STEPS = tuple(
+    (
+        (tuple(offsets[0]),),
+        (tuple(offsets[1]),),
+        (tuple(offsets[2]), tuple(offsets[3])),
+    )
+    for offsets in PAWN_OFFSETS.tolist()
+)
+
 
 class Pawn(ChessPiece):
     """Object representing a pawn piece."""
 
+    __slots__ = ('_push_steps', '_double_push_steps', '_capture_steps')
+
     DEFAULT_PIECE_CHAR: str = 'P'
     DEFAULT_PIECE_PIXEL_HEX: int = 0x183C3C1818183C7E
 
@@ -42,73 +53,55 @@ class Pawn(ChessPiece):
         super().__init__(
             board, piece_char, piece_pxl_hex, current_coords, player_controller
         )
-        self.DIRECTIONS = ((0, 1),) if self._moving_down() else ((0, -1),)
+        # Steps shared by every pawn moving in the same direction
+        (
+            self._push_steps, self._double_push_steps, self._capture_steps
+        ) = _PAWN_STEPS[0 if self._moving_down() else 1]
 
     def _moving_down(self) -> bool:
         """
-        Indicate whether the pawn is moving in the negative y direction.
+        Indicate whether the pawn is moving toward row 0. Odd-numbered
+            players start at the bottom rows (the last rows of the layout)
+            and advance toward row 0.
 
-        :return: Whether the pawn is moving in the negative y direction
+        :return: Whether the pawn is moving toward row 0
         :rtype: bool
         """
         return self._player_controller % 2 == 1
 
-    def list_moves(self) -> list[tuple[int, ...]]:
+    def _moves_bitboard(self) -> int:
         """
-        Gives a list of all available moves for the piece.
+        Gives the spaces the pawn can reach: the open spaces ahead (two of
+        them from the starting spot) and diagonal captures.
 
-        :return: List of moves currently able to be performed by
-            the piece.
-        :rtype: list[tuple[int, ...]]
+        :return: Bitboard of the reachable spaces
+        :rtype: int
         """
-        moves = []
-
-        for direction in self.DIRECTIONS:
-            # Consider open spaces
-            # Check space 1 in front
-            move_f = tuple(self._current_coords + direction)
-            if self._board.query_space(move_f) is None:
-                moves.append(move_f)
-
-            # Check space 2 in front (if in starting spot)
-            move_ff = tuple(self._current_coords + (2 * direction))
-            if (
-                    self._current_coords == self._starting_coords
-                    and self._board.query_space(move_ff) is None
-            ):
-                moves.append(move_ff)
-
-            # Consider captures
-            move_fl = tuple(self._current_coords + direction + (1, 0))
-            player_fl = self._board.query_space(move_fl)
-            if (
-                    player_fl is not None
-                    and player_fl.player_controller != self._player_controller
-            ):
-                moves.append(move_fl)
-
-            move_fr = tuple(self._current_coords + direction + (-1, 0))
-            player_fr = self._board.query_space(move_fr)
-            if (
-                    player_fr is not None
-                    and player_fr.player_controller != self._player_controller
-            ):
-                moves.append(move_fr)
-
-        return moves
+        board = self._board
+        coords = self._current_coords
+
+        # Consider open spaces ahead, two of them from the starting spot
+        moves = board.step_quiet_moves(coords, self._push_steps)
+        if moves and coords == self._starting_coords:
+            moves |= board.step_quiet_moves(coords, self._double_push_steps)
+
+        # Consider captures
+        return moves | board.step_captures(
+            coords, self._capture_steps, self._player_controller
+        )
 
     def _get_promotion_zone(self) -> int:
         """
-        Get the y-value associated with the pawn "promotion zone" in the pawn's
+        Get the row associated with the pawn "promotion zone" in the pawn's
             forward direction.
 
-        :return: y-value at which the pawn will promote
+        :return: Row at which the pawn will promote
         :rtype: int
         """
         if self._moving_down():
             return 0
         else:
-            return cast(int, self._board.dimensions[1]) - 1
+            return self._board.dimensions[0] - 1
 
     def move(self, coords: tuple[int, ...]) -> bool:
         """
@@ -125,14 +118,20 @@ class Pawn(ChessPiece):
             return False
 
         # Check for promote
-        if coords[1] == self._get_promotion_zone():
+        if coords[0] == self._get_promotion_zone():
             # TODO request promotion input from user
-            self._board.add_piece(Queen(
-                self._board,
-                self._piece_char,
-                self._piece_pxl_hex,
-                self._current_coords,
-                self._player_controller
-            ))
+            board = self._board
+            owner = board.current_players.get(self._player_controller)
+            board.remove_piece(self)
+            if owner is not None:
+                owner.remove_piece(self)
+            queen = Queen(
+                board,
+                current_coords=self._current_coords,
+                player_controller=self._player_controller
+            )
+            board.add_piece(queen)
+            if owner is not None:
+                owner.add_piece(queen)
 
         return True
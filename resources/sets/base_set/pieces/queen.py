@@ -1,19 +1,35 @@
+from resources.sets.base_set.helper._dirtables import BISHOP_DIRS
+from resources.sets.base_set.helper._dirtables import QUEEN_DIRS
+from resources.sets.base_set.helper._dirtables import ROOK_DIRS
 from resources.sets.base_set.helper.chess_piece import ChessPiece
 
+''' Rook and bishop steps, the same keys as those pieces' slide tables '''
+_ROOK_STEPS = tuple(tuple(direction) for direction in ROOK_DIRS.tolist())
+_BISHOP_STEPS = tuple(tuple(direction) for direction in BISHOP_DIRS.tolist())
+
 
 class Queen(ChessPiece):
     """Object representing a pawn piece."""
 
+    __slots__ = ()
+
     DEFAULT_PIECE_CHAR: str = 'Q'
     DEFAULT_PIECE_PIXEL_HEX: int = 0x5A24183C183C3C7E
-    DIRECTIONS = (
-        (1, 0),
-        (1, 1),
-        (0, 1),
-        (-1, 1),
-        (-1, 0),
-        (-1, -1),
-        (0, -1),
-        (1, -1),
-    )
+    DIRECTIONS = QUEEN_DIRS
     MULTI_STEP: bool = True
+
+    def _moves_bitboard(self) -> int:
+        """
+        Gives the spaces the queen can reach: a rook's and a bishop's moves
+        from its space, looked up in the board's rook and bishop tables.
+
+        :return: Bitboard of the reachable spaces
+        :rtype: int
+        """
+        board = self._board
+        coords = self._current_coords
+        player = self._player_controller
+        max_steps = max(board.dimensions)
+        return board.slide_moves(
+            coords, _ROOK_STEPS, player, max_steps
+        ) | board.slide_moves(coords, _BISHOP_STEPS, player, max_steps)
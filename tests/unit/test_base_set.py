@@ -0,0 +1,217 @@
+from omc.core import load_set
+from omc.core.model.board import Board
+from omc.core.model.board import Player
+from resources.sets.base_set.pieces.bishop import Bishop
+from resources.sets.base_set.pieces.king import King
+from resources.sets.base_set.pieces.knight import Knight
+from resources.sets.base_set.pieces.pawn import Pawn
+from resources.sets.base_set.pieces.queen import Queen
+from resources.sets.base_set.pieces.rook import Rook
+
+'''Base Set Piece Tests'''
+
+
+def make_board() -> Board:
+    """
+    Builds an empty 8x8 board with players 1 and 2
+    """
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    return b
+
+
+'''Pawn Tests'''
+
+
+def test_pawn_pushes_from_start():
+    """
+    Ensures a pawn on its starting space can move one or two spaces ahead
+    """
+    b = make_board()
+    p1 = Pawn(b, current_coords=(6, 3), player_controller=1)
+    p2 = Pawn(b, current_coords=(1, 5), player_controller=2)
+    b.add_piece(p1)
+    b.add_piece(p2)
+
+    assert p1.list_moves() == [(4, 3), (5, 3)]
+    assert p2.list_moves() == [(2, 5), (3, 5)]
+
+
+def test_pawn_single_push_after_moving():
+    """
+    Ensures a pawn that has left its starting space only moves one space
+    ahead
+    """
+    b = make_board()
+    p = Pawn(b, current_coords=(6, 3), player_controller=1)
+    b.add_piece(p)
+
+    assert p.move((5, 3))
+    assert p.list_moves() == [(4, 3)]
+
+
+def test_pawn_blocked_push():
+    """
+    Ensures a pawn cannot move onto or jump over an occupied space ahead
+    """
+    b = make_board()
+    p = Pawn(b, current_coords=(6, 3), player_controller=1)
+    b.add_piece(p)
+    b.add_piece(Rook(b, current_coords=(5, 3), player_controller=2))
+
+    assert p.list_moves() == []
+
+
+def test_pawn_blocked_double_push():
+    """
+    Ensures a pawn cannot move two spaces ahead onto an occupied space
+    """
+    b = make_board()
+    p = Pawn(b, current_coords=(6, 3), player_controller=1)
+    b.add_piece(p)
+    b.add_piece(Rook(b, current_coords=(4, 3), player_controller=1))
+
+    assert p.list_moves() == [(5, 3)]
+
+
+def test_pawn_diagonal_captures():
+    """
+    Ensures a pawn captures other players' pieces diagonally ahead, but not
+    its own player's
+    """
+    b = make_board()
+    p = Pawn(b, current_coords=(5, 3), player_controller=1)
+    b.add_piece(p)
+    b.add_piece(Rook(b, current_coords=(4, 2), player_controller=2))
+    b.add_piece(Rook(b, current_coords=(4, 4), player_controller=1))
+    b.add_piece(Rook(b, current_coords=(6, 4), player_controller=2))
+
+    assert p.list_moves() == [(3, 3), (4, 2), (4, 3)]
+
+
+def test_pawn_promotes_to_queen():
+    """
+    Ensures a pawn reaching the far row is replaced by a queen of the same
+    player
+    """
+    b = make_board()
+    p = Pawn(b, current_coords=(1, 3), player_controller=1)
+    b.add_piece(p)
+    b.get_player(1).add_piece(p)
+
+    assert p.move((0, 3))
+
+    queen = b.query_space((0, 3))
+    assert isinstance(queen, Queen)
+    assert queen.player_controller == 1
+    assert list(b.get_player(1).pieces) == [queen]
+
+
+def test_loaded_base_set_pawns_advance():
+    """
+    Ensures pawns on the loaded base set board advance toward the other
+    player
+    """
+    b = load_set.get_board("base_set", load_set.get_piece_map("base_set"))
+    p1 = b.query_space((6, 3))
+    p2 = b.query_space((1, 3))
+
+    assert isinstance(p1, Pawn) and isinstance(p2, Pawn)
+    assert p1.list_moves() == [(4, 3), (5, 3)]
+    assert p2.list_moves() == [(2, 3), (3, 3)]
+
+
+'''Queen Tests'''
+
+
+def test_queen_moves_like_rook_and_bishop():
+    """
+    Ensures a queen reaches exactly the spaces a rook and a bishop on its
+    space would
+    """
+    b = make_board()
+    b.add_piece(Pawn(b, current_coords=(3, 6), player_controller=1))
+    b.add_piece(Pawn(b, current_coords=(5, 5), player_controller=2))
+    b.add_piece(Pawn(b, current_coords=(1, 3), player_controller=2))
+    b.add_piece(Pawn(b, current_coords=(2, 2), player_controller=1))
+
+    moves = {}
+    for piece_class in (Queen, Rook, Bishop):
+        piece = piece_class(b, current_coords=(3, 3), player_controller=1)
+        b.add_piece(piece)
+        moves[piece_class] = set(piece.list_moves())
+        b.remove_piece(piece)
+
+    assert moves[Queen] == moves[Rook] | moves[Bishop]
+    assert (5, 5) in moves[Queen] and (6, 6) not in moves[Queen]
+    assert (3, 6) not in moves[Queen] and (3, 5) in moves[Queen]
+
+
+'''ChessPiece Subclass Tests'''
+
+
+class VariantPawn(Pawn):
+    """
+    Subclass of a piece with its own move generator, as a variant set would
+    define
+    """
+    DEFAULT_PIECE_CHAR: str = 'v'
+
+
+def test_subclass_keeps_inherited_move_generator():
+    """
+    Ensures a subclass of a piece with its own move generator moves like
+    that piece
+    """
+    b = make_board()
+    p = VariantPawn(b, current_coords=(6, 3), player_controller=1)
+    b.add_piece(p)
+
+    assert p.list_moves() == [(4, 3), (5, 3)]
+
+
+def test_pieces_have_no_instance_dict():
+    """
+    Ensures every base set piece keeps its attributes in slots
+    """
+    b = make_board()
+    for piece_class in (Bishop, King, Knight, Pawn, Queen, Rook):
+        piece = piece_class(b, current_coords=(4, 4), player_controller=1)
+
+        assert not hasattr(piece, '__dict__')
+
+
+class CountingRook(Rook):
+    """
+    Subclass counting how often its moves are generated
+    """
+    __slots__ = ('generated',)
+
+    def _moves_bitboard(self) -> int:
+        """
+        Counts the call and generates a rook's moves
+        """
+        self.generated = getattr(self, 'generated', 0) + 1
+        return Rook._ray_moves_bitboard(self)
+
+
+def test_list_moves_reused_until_board_changes():
+    """
+    Ensures listing and validating moves share one memo, which is refreshed
+    once the board changes
+    """
+    b = make_board()
+    r = CountingRook(b, current_coords=(4, 4), player_controller=1)
+    b.add_piece(r)
+
+    first = r.list_moves()
+    first.clear()
+    assert r.list_moves() == r.list_moves() != []
+    assert r.generated == 1
+
+    assert r.move((4, 6))
+    assert r.generated == 1
+
+    r.list_moves()
+    assert r.generated == 2
@@ -1,3 +1,5 @@
+import random
+
 import numpy as np
 import pytest
 
@@ -43,6 +45,18 @@ def test_board_add_piece():
     assert b.query_space((0, 0)) == p
 
 
+def test_board_add_piece_off_board():
+    """
+    Ensures proper function when adding a piece located off the board
+    """
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    p = SimplePiece(b, current_coords=(0, 9))
+
+    assert b.add_piece(p) is False
+    assert b.query_space((1, 1)) is None
+
+
 '''RemovePiece Tests'''
 
 
@@ -81,6 +95,21 @@ def test_remove_piece():
     assert b.query_space(p.current_coords) is None
 
 
+def test_remove_equal_piece():
+    """
+    Ensures an equal piece that is not the one on the board is not removed
+    """
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    p1 = SimplePiece(b)
+    b.add_piece(p1)
+    p2 = SimplePiece(b)
+
+    assert p1 == p2
+    assert b.remove_piece(p2) is False
+    assert b.query_space(p1.current_coords) is p1
+
+
 '''AddPlayer Tests'''
 
 
@@ -179,6 +208,57 @@ def test_board_equals():
     assert b1 == b2
 
 
+def test_board_equals_players_added_in_any_order():
+    """
+    Ensures proper function checking equality of 2 boards whose players
+    were added in a different order
+    """
+    b1 = Board.empty(1, (8, 8))
+    b1.add_player(Player(1))
+    b1.add_player(Player(2))
+    b2 = Board.empty(1, (8, 8))
+    b2.add_player(Player(2))
+    b2.add_player(Player(1))
+
+    assert b1 == b2
+
+
+def test_board_equals_distinct_pieces():
+    """
+    Ensures proper function checking equality of 2 boards holding equal but
+    distinct pieces
+    """
+    b1 = Board.empty(1, (8, 8))
+    b1.add_player(Player(1))
+    b1.add_piece(SimplePiece(b1))
+    b2 = Board.empty(1, (8, 8))
+    b2.add_player(Player(1))
+    b2.add_piece(SimplePiece(b2))
+
+    assert b1 == b2
+
+
+def test_board_not_equals_piece_type():
+    """
+    Ensures proper function checking equality of 2 boards holding different
+    piece types on the same space
+    """
+
+    class OtherSimplePiece(SimplePiece):
+        """
+        Subclass used to place a different piece type
+        """
+
+    b1 = Board.empty(1, (8, 8))
+    b1.add_player(Player(1))
+    b1.add_piece(SimplePiece(b1))
+    b2 = Board.empty(1, (8, 8))
+    b2.add_player(Player(1))
+    b2.add_piece(OtherSimplePiece(b2))
+
+    assert b1 != b2
+
+
 '''OnBoard Tests'''
 
 
@@ -201,6 +281,17 @@ def test_on_board():
     assert b.on_board((0, 0))
 
 
+def test_on_board_batch():
+    '''Ensures proper function when checking if many spaces are on the board
+    at once'''
+    b = Board.empty(1, (8, 6))
+    spaces = np.array([(0, 0), (7, 5), (-1, 0), (0, 6), (8, 0)])
+
+    assert b.on_board_batch(spaces).tolist() == [
+        True, True, False, False, False
+    ]
+
+
 '''QuerySpace Tests'''
 
 
@@ -214,6 +305,31 @@ def test_query_out_of_bounds_space():
     assert b.query_space((0, 8)) is None
 
 
+def test_query_negative_space_does_not_wrap():
+    '''Ensures querying a negative space does not wrap around to a piece on
+    the opposite edge of the board'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_piece(SimplePiece(b, current_coords=(7, 0)))
+    b.add_piece(SimplePiece(b, current_coords=(0, 7)))
+
+    assert b.query_space((-1, 0)) is None
+    assert b.query_space((0, -1)) is None
+
+
+def test_query_batch():
+    '''Ensures proper function when querying many spaces at once, including
+    out of bounds spaces'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    p = SimplePiece(b, current_coords=(2, 3))
+    b.add_piece(p)
+    spaces = np.array([(2, 3), (0, 0), (-1, 3), (2, 8)])
+
+    assert b.query_batch(spaces) == [p, None, None, None]
+    assert b.query_batch(spaces)[0] is p
+
+
 def test_query_space():
     '''Ensures proper function when querying a space'''
     b = Board.empty(1, (8, 8))
@@ -225,6 +341,248 @@ def test_query_space():
     assert b.query_space((1, 0)) is None
 
 
+'''Layout Tests'''
+
+
+def test_layout():
+    '''Ensures the layout follows pieces being added, moved and removed'''
+    b = Board.empty(1, (2, 3))
+    b.add_player(Player(1))
+    p = SimplePiece(b)
+    b.add_piece(p)
+
+    assert b.layout.shape == (2, 3)
+    assert b.layout[0, 0] is p
+
+    p.move((0, 1))
+
+    assert b.layout[0, 0] is None
+    assert b.layout[0, 1] is p
+
+    b.remove_piece(p)
+
+    assert all(space is None for space in b.layout.flat)
+
+
+def test_layout_read_only():
+    '''Ensures the layout snapshot cannot be changed in place'''
+    b = Board.empty(1, (2, 3))
+    b.add_player(Player(1))
+    p = SimplePiece(b)
+    b.add_piece(p)
+    layout = b.layout
+
+    with pytest.raises(ValueError):
+        layout[0, 0] = None
+
+    assert b.query_space((0, 0)) is p
+
+
+'''GetBoardChars Tests'''
+
+
+def test_get_board_chars():
+    '''Ensures the board display follows pieces being added and moved'''
+    b = Board.empty(1, (2, 3))
+    b.add_player(Player(1))
+    p = SimplePiece(b)
+    b.add_piece(p)
+
+    assert b.get_board_chars() == 't  \n   '
+
+    p.move((0, 1))
+
+    assert b.get_board_chars() == ' t \n   '
+
+
+'''BoardStateHash Tests'''
+
+
+def test_board_state_hash():
+    '''Ensures the board state hash follows the pieces on the board'''
+    b1 = Board.empty(1, (8, 8))
+    b1.add_player(Player(1))
+    b2 = Board.empty(2, (8, 8))
+    b2.add_player(Player(1))
+    empty_hash = b1.board_state_hash
+
+    p1 = SimplePiece(b1)
+    b1.add_piece(p1)
+    p2 = SimplePiece(b2, current_coords=(0, 1))
+    b2.add_piece(p2)
+
+    assert b1.board_state_hash != empty_hash
+    assert b1.board_state_hash != b2.board_state_hash
+
+    p1.move((0, 1))
+
+    assert b1.board_state_hash == b2.board_state_hash
+
+    b1.remove_piece(p1)
+
+    assert b1.board_state_hash == empty_hash
+
+
+def test_board_state_hash_keeps_global_random_sequence():
+    '''Ensures hashing new piece types does not draw from the global random
+    module'''
+
+    class HashedPiece(SimplePiece):
+        """
+        Subclass whose Zobrist keys have not been drawn yet
+        """
+
+    random.seed(7)
+    expected = random.random()
+
+    random.seed(7)
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_piece(HashedPiece(b, current_coords=(5, 5)))
+
+    assert random.random() == expected
+
+
+def test_board_state_hash_same_name_piece_types():
+    '''Ensures different piece types sharing a class name hash apart'''
+
+    def make_piece_type():
+        class SameNamePiece(SimplePiece):
+            """
+            Subclass redefined with the same name, as another set could
+            """
+        return SameNamePiece
+
+    b1 = Board.empty(1, (8, 8))
+    b1.add_player(Player(1))
+    b1.add_piece(make_piece_type()(b1))
+    b2 = Board.empty(1, (8, 8))
+    b2.add_player(Player(1))
+    b2.add_piece(make_piece_type()(b2))
+
+    assert b1.board_state_hash != b2.board_state_hash
+
+
+'''Bitboard Tests'''
+
+
+def test_space_square_conversion():
+    '''Ensures spaces and square indices convert back and forth'''
+    b = Board.empty(1, (8, 8))
+
+    assert b.space_to_square((0, 0)) == 0
+    assert b.space_to_square((2, 3)) == 19
+    assert b.square_to_space(19) == (2, 3)
+    assert b.bitboard_to_spaces((1 << 19) | 1) == [(0, 0), (2, 3)]
+
+
+def test_bit_scan_forward():
+    '''Ensures set bits are scanned from the lowest square up'''
+    assert list(Board.bit_scan_forward(0)) == []
+    assert list(Board.bit_scan_forward((1 << 63) | (1 << 19) | 1)) == [
+        0, 19, 63
+    ]
+
+
+def test_ray_moves():
+    '''Ensures a ray stops at the first piece and only captures opponents'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    b.add_piece(SimplePiece(b, current_coords=(0, 3), player_controller=1))
+    b.add_piece(SimplePiece(b, current_coords=(3, 0), player_controller=2))
+
+    up = b.ray_moves((0, 0), (0, 1), 1, 8)
+    right = b.ray_moves((0, 0), (1, 0), 1, 8)
+    back = b.ray_moves((0, 7), (0, -1), 1, 8)
+    single_step = b.ray_moves((0, 0), (1, 1), 1, 1)
+
+    assert b.bitboard_to_spaces(up) == [(0, 1), (0, 2)]
+    assert b.bitboard_to_spaces(right) == [(1, 0), (2, 0), (3, 0)]
+    assert b.bitboard_to_spaces(back) == [(0, 4), (0, 5), (0, 6)]
+    assert b.bitboard_to_spaces(single_step) == [(1, 1)]
+
+
+def test_slide_moves():
+    '''Ensures sliding along several rays follows pieces added and removed'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    rook_directions = ((1, 0), (-1, 0), (0, 1), (0, -1))
+    blocker = SimplePiece(b, current_coords=(0, 2), player_controller=1)
+    b.add_piece(blocker)
+    b.add_piece(SimplePiece(b, current_coords=(2, 0), player_controller=2))
+
+    moves = b.slide_moves((0, 0), rook_directions, 1, 8)
+
+    assert b.bitboard_to_spaces(moves) == [(0, 1), (1, 0), (2, 0)]
+
+    b.remove_piece(blocker)
+    moves = b.slide_moves((0, 0), rook_directions, 1, 8)
+    expected_moves = 0
+    for direction in rook_directions:
+        expected_moves |= b.ray_moves((0, 0), direction, 1, 8)
+
+    assert moves == expected_moves
+
+
+def test_piece_bitboard():
+    '''Ensures piece bitboards follow each player's pieces of each type'''
+    class OtherSimplePiece(SimplePiece):
+        """
+        Subclass used to place a different piece type
+        """
+
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    p = SimplePiece(b, current_coords=(0, 1), player_controller=1)
+    b.add_piece(p)
+    b.add_piece(OtherSimplePiece(b, current_coords=(0, 2)))
+    b.add_piece(SimplePiece(b, current_coords=(0, 3), player_controller=2))
+
+    assert b.piece_bitboard(1, SimplePiece) == 1 << 1
+    assert b.piece_bitboard(1, OtherSimplePiece) == 1 << 2
+    assert b.piece_bitboard(2, SimplePiece) == 1 << 3
+
+    b.remove_piece(p)
+
+    assert b.piece_bitboard(1, SimplePiece) == 0
+
+
+def test_step_moves():
+    '''Ensures steps stay on the board and only capture opponents'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    b.add_piece(SimplePiece(b, current_coords=(1, 2), player_controller=1))
+    b.add_piece(SimplePiece(b, current_coords=(2, 1), player_controller=2))
+    knight_steps = (
+        (1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1)
+    )
+
+    moves = b.step_moves((0, 0), knight_steps, 1)
+
+    assert b.bitboard_to_spaces(moves) == [(2, 1)]
+
+
+def test_step_quiet_moves_and_captures():
+    '''Ensures quiet steps need empty spaces and captures need opponents'''
+    b = Board.empty(1, (8, 8))
+    b.add_player(Player(1))
+    b.add_player(Player(2))
+    b.add_piece(SimplePiece(b, current_coords=(3, 4), player_controller=1))
+    b.add_piece(SimplePiece(b, current_coords=(4, 4), player_controller=2))
+    b.add_piece(SimplePiece(b, current_coords=(2, 4), player_controller=1))
+    steps = ((0, 1), (1, 1), (-1, 1))
+
+    quiet = b.step_quiet_moves((3, 3), steps)
+    captures = b.step_captures((3, 3), steps, 1)
+
+    assert b.bitboard_to_spaces(quiet) == []
+    assert b.bitboard_to_spaces(captures) == [(4, 4)]
+
+
 '''Piece Class Tests'''
 
 
@@ -393,6 +751,33 @@ def test_piece_pxl_hex():
     assert p.piece_pxl_hex == 1
 
 
+def test_piece_pxl_rows():
+    """
+    Ensures a piece's pixel-hex is unpacked into rows, top row first
+    """
+    test_board = Board.empty(1, (8, 8))
+    test_board.add_player(Player(1))
+    default_p = SimplePiece(test_board)
+    custom_p = SimplePiece(test_board, 't', 0x0100000000000080)
+
+    assert default_p.piece_pxl_rows == (0xFF,) + (0x18,) * 7
+    assert custom_p.piece_pxl_rows == (0x01, 0, 0, 0, 0, 0, 0, 0x80)
+
+
+def test_piece_pxl_grid():
+    """
+    Ensures a piece's pixel-hex is unpacked into an 8x8 pixel grid
+    """
+    test_board = Board.empty(1, (8, 8))
+    test_board.add_player(Player(1))
+    p = SimplePiece(test_board, 't', 0x0100000000000080)
+    expected_grid = np.zeros((8, 8), dtype=np.uint8)
+    expected_grid[0, 7] = 1
+    expected_grid[7, 0] = 1
+
+    assert np.array_equal(p.piece_pxl_grid, expected_grid)
+
+
 def test_negative_x_coord():
     """
     Ensures proper function when a piece has a negative x coordinate
@@ -536,6 +921,66 @@ def test_move():
     assert test_board.query_space(expected_current_coords) == p
 
 
+def test_move_list_coords():
+    """
+    Ensures move rejects non-tuple coordinates instead of raising
+    """
+    test_board = Board.empty(1, (8, 8))
+    test_board.add_player(Player(1))
+    p = SimplePiece(test_board)
+    test_board.add_piece(p)
+
+    assert p.move([0, 1]) is False
+    assert p.current_coords == (0, 0)
+    assert test_board.query_space((0, 0)) is p
+
+
+def test_move_capture():
+    """
+    Ensures moving onto another player's piece takes it off the board
+    """
+    test_board = Board.empty(1, (8, 8))
+    test_board.add_player(Player(1))
+    test_board.add_player(Player(2))
+    p = SimplePiece(test_board)
+    test_board.add_piece(p)
+    captured = SimplePiece(
+        test_board, current_coords=(0, 1), player_controller=2
+    )
+    test_board.add_piece(captured)
+
+    assert p.move((0, 1)) is True
+    assert test_board.query_space((0, 0)) is None
+    assert test_board.query_space((0, 1)) is p
+    assert test_board.remove_piece(captured) is False
+
+
+def test_move_reuses_listed_moves():
+    """
+    Ensures moves are only listed again once the board has changed
+    """
+    class CountingPiece(SimplePiece):
+        list_moves_calls = 0
+
+        def list_moves(self) -> list[tuple[int, ...]]:
+            CountingPiece.list_moves_calls += 1
+            return super().list_moves()
+
+    test_board = Board.empty(1, (8, 8))
+    test_board.add_player(Player(1))
+    p = CountingPiece(test_board)
+    test_board.add_piece(p)
+
+    assert p.move((2, 2)) is False
+    assert p.move((3, 3)) is False
+    assert CountingPiece.list_moves_calls == 1
+
+    test_board.add_piece(SimplePiece(test_board, current_coords=(5, 5)))
+
+    assert p.move((2, 2)) is False
+    assert CountingPiece.list_moves_calls == 2
+
+
 '''SetPlayerControl Tests'''
 
 
@@ -1,4 +1,5 @@
 # Code by Chandler McDowell 2023
+import sys
 from os import remove
 from os.path import exists
 
@@ -70,6 +71,63 @@ def test_get_piece_names():
     assert actual_base_set_names == expected_base_set_names
 
 
+def test_get_piece_map_cached():
+    """Ensures the piece map of an unchanged set is reused across loads"""
+    first_piece_map = load_set.get_piece_map("base_set")
+    second_piece_map = load_set.get_piece_map("base_set")
+    assert first_piece_map == second_piece_map
+    assert all(
+        first_piece_map[name] is second_piece_map[name]
+        for name in first_piece_map
+    )
+
+
+def test_get_piece_map_returns_copy():
+    """Ensures changing a returned piece map does not change later loads"""
+    piece_map = load_set.get_piece_map("base_set")
+    del piece_map['queen']
+
+    assert 'queen' in load_set.get_piece_map("base_set")
+
+
+def test_get_piece_map_reload(monkeypatch):
+    """Ensures a stale set reloads pieces together with their imports"""
+    set_modules = {
+        name: module for name, module in sys.modules.items()
+        if name.startswith('resources.sets.base_set.')
+    }
+    old_queen = load_set.get_piece_map("base_set")['queen']
+    # A cache entry with an outdated mtime, as if the piece files changed
+    monkeypatch.setitem(load_set._PIECE_MAP_CACHE, 'base_set', (-1.0, {}))
+    try:
+        piece_map = load_set.get_piece_map("base_set")
+        pawn_module = sys.modules['resources.sets.base_set.pieces.pawn']
+
+        assert piece_map['queen'] is not old_queen
+        assert pawn_module.Queen is piece_map['queen']
+    finally:
+        sys.modules.update(set_modules)
+
+
+def test_get_piece_map_shares_imported_classes():
+    """Ensures loaded piece classes are the ones pieces import each other by"""
+    from resources.sets.base_set.pieces.pawn import Queen
+
+    assert load_set.get_piece_map("base_set")['queen'] is Queen
+
+
+'''ParseRawPieceName tests'''
+
+
+def test_parse_raw_piece_name():
+    """Ensures a raw piece name is split into player number and piece name"""
+    assert load_set.parse_raw_piece_name("p2_pawn") == (2, "pawn")
+    assert load_set.parse_raw_piece_name("p12_king") == (12, "king")
+    assert load_set.parse_raw_piece_name("2") == (2, "")
+    with pytest.raises(ValueError):
+        load_set.parse_raw_piece_name("pf_rook")
+
+
 '''GetBoard tests'''
 
 
@@ -134,6 +192,17 @@ def test_invalid_board_layout_value():
         )
 
 
+def test_ragged_grid_board_layout():
+    """Ensures proper function when a set has a grid board layout with rows
+    of differing lengths"""
+    with pytest.raises(InvalidBoardLayoutException):
+        base_set_piece_map = dict()
+        load_set.get_board(
+            "test_sets/test_set_ragged_grid_board_layout",
+            base_set_piece_map
+        )
+
+
 def test_extra_values_board():
     """Ensures proper function when a set has a board with extra values"""
     with pytest.raises(InvalidBoardFormatException):
@@ -143,6 +212,15 @@ def test_extra_values_board():
         )
 
 
+def test_trailing_content_board():
+    """Ensures proper function when a set has content after its board line"""
+    with pytest.raises(InvalidBoardLayoutException):
+        base_set_piece_map = dict()
+        load_set.get_board(
+            "test_sets/test_set_trailing_content_board", base_set_piece_map
+        )
+
+
 def test_invalid_board():
     """Ensures proper function when a set has a board with non-integer column
     dimension"""
@@ -153,6 +231,74 @@ def test_invalid_board():
         )
 
 
+def test_board_layout_num_rows():
+    """Ensures proper function when a set has a board layout with a
+    different number of rows than its row dimension"""
+    with pytest.raises(InvalidBoardLayoutException):
+        base_set_piece_map = dict()
+        load_set.get_board(
+            "test_sets/test_set_board_layout_num_rows", base_set_piece_map
+        )
+
+
+def test_board_layout_num_cols():
+    """Ensures proper function when a set has a list board layout with rows
+    of differing lengths"""
+    with pytest.raises(InvalidBoardLayoutException):
+        base_set_piece_map = dict()
+        load_set.get_board(
+            "test_sets/test_set_board_layout_num_cols", base_set_piece_map
+        )
+
+
+def test_invalid_player_prefix_board_piece():
+    """Ensures proper function when a set has a board piece without a valid
+    player number"""
+    with pytest.raises(InvalidBoardLayoutException, match=r"'pf_rook'"):
+        load_set.get_board(
+            "test_sets/test_set_invalid_player_prefix_board_piece",
+            load_set.get_piece_map("base_set")
+        )
+
+
+def test_nonstring_board_piece():
+    """Ensures a board with a non-string piece in its layout loads, without
+    placing that piece"""
+    board = load_set.get_board(
+        "test_sets/test_set_nonstring_board_piece",
+        load_set.get_piece_map("base_set")
+    )
+
+    assert board.query_space((0, 0)) is None
+    assert board.query_space((0, 1)) is not None
+
+
+def test_get_non_square_board():
+    """Ensures every piece of a non-square board is placed on the board and
+    given to its player"""
+    base_piece_map = load_set.get_piece_map("base_set")
+    board = load_set.get_board(
+        "test_sets/test_set_non_square_board", base_piece_map
+    )
+
+    assert board.dimensions == (2, 3)
+    assert board.get_board_chars() == 'K R\n  K'
+    assert len(board.get_player(1).pieces) == 2
+    assert len(board.get_player(2).pieces) == 1
+
+
+def test_get_non_square_board_moves():
+    """Ensures pieces of a loaded non-square board move along the board's
+    (row, column) axes"""
+    base_piece_map = load_set.get_piece_map("base_set")
+    board = load_set.get_board(
+        "test_sets/test_set_non_square_board", base_piece_map
+    )
+    rook = board.query_space((0, 2))
+
+    assert rook.list_moves() == [(0, 1), (1, 2)]
+
+
 @pytest.mark.xfail(reason="Needs to be adapted to new Board structure")
 def test_get_board():
     """Ensures the correct board is gotten for a set"""